@@ -0,0 +1,53 @@
+"""add transaction history and api key lookup indexes
+
+Replaces the single-column api_keys.key_prefix index with (key_prefix, revoked).
+
+Revision ID: 4c1d8e2f7a90
+Revises: b9eaec79b93d
+Create Date: 2026-10-14 04:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1d8e2f7a90'
+down_revision: Union[str, Sequence[str], None] = 'b9eaec79b93d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    # Tables (and these indexes) are created by init_db on a fresh database
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _has_table("transactions"):
+        op.create_index(
+            "ix_transactions_wallet_created",
+            "transactions",
+            ["wallet_id", sa.text("created_at DESC")],
+            if_not_exists=True,
+        )
+    if _has_table("api_keys"):
+        op.create_index(
+            "ix_api_keys_prefix_revoked",
+            "api_keys",
+            ["key_prefix", "revoked"],
+            if_not_exists=True,
+        )
+        # Redundant with the composite index above (key_prefix is its leading column)
+        op.drop_index("ix_api_keys_key_prefix", table_name="api_keys", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table("api_keys"):
+        op.create_index("ix_api_keys_key_prefix", "api_keys", ["key_prefix"], if_not_exists=True)
+    op.drop_index("ix_api_keys_prefix_revoked", table_name="api_keys", if_exists=True)
+    op.drop_index("ix_transactions_wallet_created", table_name="transactions", if_exists=True)
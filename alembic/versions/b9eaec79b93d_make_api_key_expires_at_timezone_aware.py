@@ -0,0 +1,49 @@
+"""make api_keys.expires_at timezone aware
+
+Revision ID: b9eaec79b93d
+Revises: 
+Create Date: 2026-10-14 04:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9eaec79b93d'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _needs_alter() -> bool:
+    # Tables are created by init_db on first start; SQLite has no tz-aware type
+    bind = op.get_bind()
+    return bind.dialect.name == "postgresql" and sa.inspect(bind).has_table("api_keys")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _needs_alter():
+        # Existing values were written with datetime.utcnow()
+        op.alter_column(
+            "api_keys",
+            "expires_at",
+            type_=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            postgresql_using="expires_at AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _needs_alter():
+        op.alter_column(
+            "api_keys",
+            "expires_at",
+            type_=sa.DateTime(),
+            existing_nullable=False,
+            postgresql_using="expires_at AT TIME ZONE 'UTC'",
+        )
@@ -114,14 +114,15 @@ async def list_api_keys(
         limit=limit
     )
     
-    # Format response with is_valid computed field
+    # Format response with is_valid computed field; UUIDs and datetimes
+    # are serialized natively by orjson
     keys_data = [
         {
-            "id": str(key.id),
+            "id": key.id,
             "name": key.name,
             "permissions": key.permissions,
-            "created_at": key.created_at.isoformat(),
-            "expires_at": key.expires_at.isoformat(),
+            "created_at": key.created_at,
+            "expires_at": key.expires_at,
             "is_valid": key.is_valid()
         }
         for key in api_keys
@@ -1,6 +1,6 @@
 import secrets
 import httpx
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict
 from fastapi import APIRouter, Request, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,7 +11,7 @@ from app.models import User
 from app.schemas.auth import UserResponse
 from app.services import auth as auth_service
 from app.api.deps import get_current_user_from_token
-from app.utils.responses import success_response, fail_response
+from app.utils.responses import ORJSONResponse, success_response, fail_response
 from app.utils.logger import logger
 from app.config import settings
 
@@ -27,7 +27,7 @@ _oauth_states: Dict[str, datetime] = {}
 async def google_login():
     """Get Google OAuth authorization URL."""
     state = secrets.token_urlsafe(32)
-    _oauth_states[state] = datetime.utcnow()
+    _oauth_states[state] = datetime.now(timezone.utc)
     
     params = {
         "client_id": settings.GOOGLE_CLIENT_ID,
@@ -75,7 +75,7 @@ async def google_callback(request: Request, db: AsyncSession = Depends(get_db)):
             message="Invalid or expired state parameter. Please try logging in again."
         )
     
-    state_age = datetime.utcnow() - _oauth_states[state]
+    state_age = datetime.now(timezone.utc) - _oauth_states[state]
     if state_age > timedelta(minutes=5):
         del _oauth_states[state]
         return fail_response(
@@ -126,4 +126,20 @@ async def google_callback(request: Request, db: AsyncSession = Depends(get_db)):
 @router.get("/me", response_model=UserResponse, summary="Get Current User")
 async def get_current_user(current_user: User = Depends(get_current_user_from_token)):
     """Get the currently authenticated user's details."""
-    return current_user
+    if not current_user:
+        return fail_response(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            message="Invalid or missing authentication credentials"
+        )
+    
+    # Build the schema from trusted ORM data without re-validating it. Returning
+    # a response directly also skips FastAPI's response_model validation; the
+    # response_model is kept for the OpenAPI schema.
+    user = UserResponse.model_construct(
+        id=current_user.id,
+        email=current_user.email,
+        name=current_user.name,
+        google_id=current_user.google_id,
+        created_at=current_user.created_at
+    )
+    return ORJSONResponse(content=user.model_dump())
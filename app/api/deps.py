@@ -160,8 +160,9 @@ def require_permissions(required_permissions: List[str]):
             return user
         
         # Check API key permissions
+        granted = api_key.perm_set
         for permission in required_permissions:
-            if permission not in api_key.permissions:
+            if permission not in granted:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail=f"API key missing required permission: {permission}"
@@ -460,15 +460,16 @@ async def get_transaction_history(
         limit=limit
     )
     
-    # Format transactions for response
+    # Format transactions for response; UUIDs, enums and datetimes are
+    # serialized natively by orjson in a single pass over the list
     transactions_data = [
         {
-            "id": str(txn.id),
-            "type": txn.type.value,
+            "id": txn.id,
+            "type": txn.type,
             "amount": str(txn.amount),
             "reference": txn.reference,
-            "status": txn.status.value,
-            "created_at": txn.created_at.isoformat()
+            "status": txn.status,
+            "created_at": txn.created_at
         }
         for txn in transactions
     ]
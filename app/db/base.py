@@ -1,10 +1,25 @@
 import uuid
 from datetime import datetime, timezone
 from sqlalchemy import DateTime, select
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import Mapped, mapped_column, DeclarativeBase
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+class UTCDateTime(TypeDecorator):
+    """Timezone-aware DateTime that always returns UTC-aware values.
+
+    SQLite does not store offsets, so naive values read back are tagged as UTC.
+    """
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+
 class Base(DeclarativeBase):
     """Base class for all models"""
     pass
@@ -10,6 +10,7 @@ from app.api import app as api_router
 from app.middleware.correlation import CorrelationIdMiddleware
 from app.middleware.security import SecurityHeadersMiddleware
 from app.utils.logger import logger
+from app.utils.responses import ORJSONResponse
 
 
 @asynccontextmanager
@@ -36,6 +37,7 @@ app = FastAPI(
     description="Wallet service with Paystack integration and API key authentication",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -1,62 +1,93 @@
-import uuid
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+import logging
+from random import getrandbits
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.utils.logger import set_correlation_id, clear_correlation_id, logger
 
+# Probe and docs endpoints carry no tracing value; skip correlation for them
+UNTRACED_PATHS = frozenset({"/", "/health", "/docs", "/redoc", "/openapi.json"})
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
+
+class CorrelationIdMiddleware:
     """
     Middleware to extract or generate correlation IDs for request tracing.
-    
+
     Extracts correlation ID from request headers or generates a new one.
     Adds correlation ID to response headers and logging context.
+
+    Implemented as pure ASGI middleware so no Request/Response objects are
+    built and the response body is streamed through untouched.
     """
-    
-    def __init__(self, app, correlation_id_header: str = "X-Correlation-ID"):
-        super().__init__(app)
-        self.correlation_id_header = correlation_id_header
-    
-    async def dispatch(self, request: Request, call_next):
+
+    def __init__(self, app: ASGIApp, correlation_id_header: str = "X-Correlation-ID"):
+        self.app = app
+        # ASGI header names are lowercased bytes; precompute once for matching
+        self._header_bytes = correlation_id_header.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process incoming request and add correlation ID.
         """
+        if scope["type"] != "http" or scope["path"] in UNTRACED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
         # Extract or generate correlation ID
-        correlation_id = request.headers.get(
-            self.correlation_id_header,
-            str(uuid.uuid4())
-        )
-        
+        header_name = self._header_bytes
+        correlation_id_value = None
+        for name, value in scope["headers"]:
+            if name == header_name:
+                correlation_id_value = value
+                break
+
+        if correlation_id_value:
+            correlation_id = correlation_id_value.decode("latin-1")
+        else:
+            correlation_id = "%032x" % getrandbits(128)
+            correlation_id_value = correlation_id.encode("latin-1")
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        # Skip message formatting and extra dicts when INFO is filtered out
+        log_info = logger.isEnabledFor(logging.INFO)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Log response
+                if log_info:
+                    status_code = message["status"]
+                    logger.info(
+                        "Request completed: %s %s - Status: %s", method, path, status_code,
+                        extra={
+                            "method": method,
+                            "path": path,
+                            "status_code": status_code
+                        }
+                    )
+
+                # Add correlation ID to response headers for client tracking
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (header_name, correlation_id_value),
+                ]
+            await send(message)
+
         # Set in logging context
         set_correlation_id(correlation_id)
-        
+
         # Log incoming request
-        logger.info(
-            f"Incoming request: {request.method} {request.url.path}",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "client": request.client.host if request.client else "unknown"
-            }
-        )
-        
-        try:
-            # Process the request
-            response = await call_next(request)
-            
-            # Log response
+        if log_info:
             logger.info(
-                f"Request completed: {request.method} {request.url.path} - Status: {response.status_code}",
+                "Incoming request: %s %s", method, path,
                 extra={
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code
+                    "method": method,
+                    "path": path,
+                    "client": client[0] if client else "unknown"
                 }
             )
-            
-            # Add correlation ID to response headers for client tracking
-            response.headers[self.correlation_id_header] = correlation_id
-            
-            return response
-            
+
+        try:
+            # Process the request
+            await self.app(scope, receive, send_wrapper)
         finally:
             clear_correlation_id()
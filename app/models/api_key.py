@@ -1,23 +1,30 @@
+import sys
 import uuid
-from datetime import datetime
-from sqlalchemy import String, DateTime, Column, ForeignKey, Boolean, JSON
+from datetime import datetime, timezone
+from functools import cached_property
+from sqlalchemy import String, Column, ForeignKey, Boolean, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
-from app.db.base import BaseModel
+from app.db.base import BaseModel, UTCDateTime
 
 
 class APIKey(BaseModel):
     """API Key model for service-to-service authentication."""
     
     __tablename__ = "api_keys"
+    __table_args__ = (
+        # Supports the prefix lookup in validate_api_key on cache misses; also
+        # serves key_prefix-only lookups, so no separate key_prefix index
+        Index("ix_api_keys_prefix_revoked", "key_prefix", "revoked"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    key_prefix = Column(String, index=True, nullable=False)
+    key_prefix = Column(String, nullable=False)
     key_hash = Column(String, unique=True, nullable=False)
     name = Column(String, nullable=False)
     permissions = Column(JSON, nullable=False)  # List of permissions: ["deposit", "transfer", "read"]
-    expires_at = Column(DateTime, nullable=False)
+    expires_at = Column(UTCDateTime, nullable=False)
     revoked = Column(Boolean, default=False, nullable=False)
     
     # Relationships
@@ -28,4 +35,9 @@ class APIKey(BaseModel):
     
     def is_valid(self) -> bool:
         """Check if API key is valid (not expired and not revoked)."""
-        return not self.revoked and datetime.utcnow() < self.expires_at
+        return not self.revoked and datetime.now(timezone.utc) < self.expires_at
+    
+    @cached_property
+    def perm_set(self) -> frozenset[str]:
+        """Permissions as a frozenset of interned strings for O(1) membership checks."""
+        return frozenset(sys.intern(permission) for permission in self.permissions)
@@ -1,7 +1,7 @@
 import uuid
 from decimal import Decimal
 from enum import Enum
-from sqlalchemy import String, Column, ForeignKey, Numeric, Enum as SQLEnum, JSON
+from sqlalchemy import String, Column, ForeignKey, Numeric, Enum as SQLEnum, JSON, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.base import BaseModel
@@ -25,6 +25,11 @@ class Transaction(BaseModel):
     """Transaction model for tracking wallet activities."""
     
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Serves transaction history (WHERE wallet_id = ? ORDER BY created_at DESC LIMIT n)
+        # as an index range scan with no sort step
+        Index("ix_transactions_wallet_created", "wallet_id", text("created_at DESC")),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     wallet_id = Column(UUID(as_uuid=True), ForeignKey("wallets.id", ondelete="CASCADE"), nullable=False)
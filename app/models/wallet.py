@@ -7,10 +7,13 @@ from sqlalchemy.dialects.postgresql import UUID
 from app.db.base import BaseModel
 
 
+_WALLET_NUMBER_SPACE = 10 ** 13
+
+
 def generate_wallet_number() -> str:
     """Generate a unique 13-digit wallet number."""
-    # Generate a random 13-digit number
-    return ''.join([str(secrets.randbelow(10)) for _ in range(13)])
+    # Draw all 13 digits from a single random integer, zero-padded
+    return f"{secrets.randbelow(_WALLET_NUMBER_SPACE):013d}"
 
 
 class Wallet(BaseModel):
@@ -33,7 +33,7 @@ class DepositResponse(BaseModel):
 
 class TransferRequest(BaseModel):
     """Schema for wallet transfer request."""
-    wallet_number: str = Field(..., min_length=13, max_length=13)
+    wallet_number: str = Field(..., pattern=r"^[0-9]{13}$", description="13-digit recipient wallet number")
     amount: Decimal = Field(..., gt=0, description="Amount to transfer (must be positive)")
 
 
@@ -1,13 +1,20 @@
 import secrets
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Optional
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import APIKey
 from app.schemas.api_key import APIKeyCreate, APIKeyRollover
-from app.services.auth import hash_key, parse_expiry
+from app.services.auth import hash_key, parse_expiry, verify_key_async
 from app.utils.logger import logger
 
+# In-process cache of validated API keys: digest of plain key -> (deadline, key fields).
+# Revocation evicts locally; other workers pick it up once the short TTL lapses.
+API_KEY_CACHE_TTL_SECONDS = 60
+API_KEY_CACHE_MAX_SIZE = 4096
+_api_key_cache: dict[str, tuple[float, dict]] = {}
+
 
 def generate_api_key() -> str:
     """
@@ -44,7 +51,7 @@ async def create_api_key(
         select(func.count(APIKey.id))
         .where(APIKey.user_id == user_id)
         .where(APIKey.revoked == False)
-        .where(APIKey.expires_at > datetime.utcnow())
+        .where(APIKey.expires_at > datetime.now(timezone.utc))
     )
     active_count = result.scalar()
     
@@ -79,7 +86,6 @@ async def create_api_key(
     
     db.add(api_key)
     await db.commit()
-    await db.refresh(api_key)
     
     logger.info(f"API key created successfully", extra={"key_id": str(api_key.id), "expires_at": expires_at.isoformat()})
     
@@ -117,7 +123,7 @@ async def rollover_api_key(
         logger.warning(f"API key rollover failed - key not found", extra={"key_id": rollover_data.expired_key_id})
         raise ValueError("API key not found or not owned by user")
     
-    if old_key.expires_at > datetime.utcnow():
+    if old_key.expires_at > datetime.now(timezone.utc):
         logger.warning(f"API key rollover failed - key not expired", extra={"key_id": rollover_data.expired_key_id})
         raise ValueError("API key is not expired yet")
     
@@ -140,7 +146,6 @@ async def rollover_api_key(
     
     db.add(new_key)
     await db.commit()
-    await db.refresh(new_key)
     
     logger.info(f"API key rolled over successfully", extra={"new_key_id": str(new_key.id)})
     
@@ -184,7 +189,7 @@ async def revoke_api_key(
     
     api_key.revoked = True
     await db.commit()
-    await db.refresh(api_key)
+    _evict_cached_api_key(api_key.id)
     
     logger.info(f"API key revoked successfully", extra={"key_id": key_id, "user_id": user_id})
     
@@ -201,6 +206,16 @@ async def validate_api_key(
     if not api_key.startswith("sk_live_") or len(api_key) < 16:
         return None
         
+    # Serve recently validated keys without a DB lookup or hash verification
+    cache_key = hash_key(api_key)
+    cached = _api_key_cache.get(cache_key)
+    if cached:
+        deadline, fields = cached
+        if time.monotonic() < deadline and datetime.now(timezone.utc) < fields["expires_at"]:
+            # Transient (session-less) copy; callers only read its fields
+            return APIKey(**dict(fields, permissions=list(fields["permissions"])), revoked=False)
+        _api_key_cache.pop(cache_key, None)
+    
     # Extract prefix
     key_prefix = api_key[8:16]
     
@@ -209,19 +224,46 @@ async def validate_api_key(
         select(APIKey)
         .where(APIKey.key_prefix == key_prefix)
         .where(APIKey.revoked == False)
-        .where(APIKey.expires_at > datetime.utcnow())
+        .where(APIKey.expires_at > datetime.now(timezone.utc))
     )
     # Theoretically there could be prefix collisions (rare), so we get all matches
     candidate_keys = result.scalars().all()
     
     # Verify hash against candidates
-    from app.services.auth import verify_key
     for key_model in candidate_keys:
-        if verify_key(api_key, key_model.key_hash):
+        if await verify_key_async(api_key, key_model.key_hash):
+            _cache_api_key(cache_key, key_model)
             return key_model
             
     return None
 
+
+def _cache_api_key(cache_key: str, key_model: APIKey) -> None:
+    """Remember a validated API key for API_KEY_CACHE_TTL_SECONDS."""
+    if len(_api_key_cache) >= API_KEY_CACHE_MAX_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        _api_key_cache.pop(next(iter(_api_key_cache)), None)
+    
+    _api_key_cache[cache_key] = (
+        time.monotonic() + API_KEY_CACHE_TTL_SECONDS,
+        {
+            "id": key_model.id,
+            "user_id": key_model.user_id,
+            "key_prefix": key_model.key_prefix,
+            "name": key_model.name,
+            "permissions": tuple(key_model.permissions),
+            "expires_at": key_model.expires_at,
+        },
+    )
+
+
+def _evict_cached_api_key(key_id) -> None:
+    """Remove a revoked API key from the validation cache."""
+    for cache_key, (_, fields) in list(_api_key_cache.items()):
+        if fields["id"] == key_id:
+            del _api_key_cache[cache_key]
+
+
 async def list_user_api_keys(
     db: AsyncSession,
     user_id: str,
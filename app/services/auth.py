@@ -1,8 +1,13 @@
 import bcrypt
+import hashlib
+import hmac
 import httpx
-from datetime import datetime, timedelta
+import jwt
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
-from jose import JWTError, jwt
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -12,59 +17,105 @@ from app.models import User
 GOOGLE_TOKEN_ENDPOINT = "https://oauth2.googleapis.com/token"
 GOOGLE_USERINFO_ENDPOINT = "https://www.googleapis.com/oauth2/v1/userinfo"
 
+# Allowed API key expiry values (see APIKeyCreate.expiry)
+_EXPIRY_DELTAS = {
+    "1H": timedelta(hours=1),
+    "1D": timedelta(days=1),
+    "1M": timedelta(days=30),
+    "1Y": timedelta(days=365),
+}
+
+_API_KEY_PEPPER = settings.API_KEY_PEPPER.encode("utf-8")
+_ACCESS_TOKEN_DELTA = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+# LRU of verified JWT payloads: sha256(token) -> payload
+TOKEN_CACHE_MAX_SIZE = 1024
+_token_cache: OrderedDict[bytes, dict] = OrderedDict()
+
 
 def hash_key(key: str) -> str:
-    """Hash an API key or password using bcrypt."""
-    return bcrypt.hashpw(key.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    """
+    Hash an API key using HMAC-SHA256 with the server-side pepper.
+    
+    API keys are generated server-side with 256 bits of entropy, so a slow
+    salted KDF adds nothing over a keyed hash.
+    """
+    return hmac.new(_API_KEY_PEPPER, key.encode("utf-8"), hashlib.sha256).hexdigest()
 
 
 def verify_key(plain_key: str, hashed_key: str) -> bool:
     """Verify a plain key against its hash."""
-    return bcrypt.checkpw(
-        plain_key.encode("utf-8"),
-        hashed_key.encode("utf-8"),
-    )
+    # Keys issued before the switch to HMAC are stored as bcrypt hashes
+    if hashed_key.startswith("$2"):
+        return bcrypt.checkpw(
+            plain_key.encode("utf-8"),
+            hashed_key.encode("utf-8"),
+        )
+    return hmac.compare_digest(hashed_key, hash_key(plain_key))
+
+
+async def verify_key_async(plain_key: str, hashed_key: str) -> bool:
+    """Verify a plain key against its hash without blocking the event loop."""
+    # bcrypt is ~100ms of CPU work (and releases the GIL), so run legacy
+    # hashes in the threadpool; HMAC verification is cheap enough to run inline
+    if hashed_key.startswith("$2"):
+        return await run_in_threadpool(verify_key, plain_key, hashed_key)
+    return verify_key(plain_key, hashed_key)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = datetime.now(timezone.utc) + (expires_delta or _ACCESS_TOKEN_DELTA)
     
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
+def _decode_token_cached(token: str) -> dict:
+    """
+    Verify a JWT signature once per distinct token.
+    
+    Entries are keyed by the token's SHA-256 digest so raw credentials are not
+    held in memory. Invalid tokens raise and are never cached, so junk tokens
+    cannot evict valid entries.
+    """
+    cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = _token_cache.get(cache_key)
+    
+    if payload is None:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+        _token_cache[cache_key] = payload
+    else:
+        _token_cache.move_to_end(cache_key)
+    
+    return payload
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and verify a JWT access token."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+        payload = _decode_token_cached(token)
+    except jwt.InvalidTokenError:
+        return None
+    
+    # A cached payload can outlive its token, so expiry is re-checked on every call
+    if payload.get("exp", 0) <= time.time():
         return None
+    # Copy so callers cannot mutate the cached entry
+    return dict(payload)
 
 
 def parse_expiry(expiry: str) -> datetime:
     """Parse expiry string (1H, 1D, 1M, 1Y) to datetime."""
-    value = int(expiry[:-1])
-    unit = expiry[-1].upper()
-    now = datetime.utcnow()
-    
-    if unit == "H":
-        return now + timedelta(hours=value)
-    elif unit == "D":
-        return now + timedelta(days=value)
-    elif unit == "M":
-        return now + timedelta(days=value * 30)
-    elif unit == "Y":
-        return now + timedelta(days=value * 365)
-    else:
+    delta = _EXPIRY_DELTAS.get(expiry)
+    if delta is None:
         raise ValueError(f"Invalid expiry format: {expiry}")
+    return datetime.now(timezone.utc) + delta
 
 
 async def process_google_oauth_callback(db: AsyncSession, code: str) -> Tuple[User, str]:
@@ -1,4 +1,4 @@
-import uuid
+import secrets
 from decimal import Decimal
 from typing import Dict
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -30,7 +30,7 @@ async def initialize_deposit(
         Exception: If Paystack initialization fails
     """
     # Generate unique reference
-    reference = f"DEP_{uuid.uuid4().hex[:12].upper()}"
+    reference = f"DEP_{secrets.token_hex(6).upper()}"
     
     logger.info(
         f"Initializing deposit for wallet: {wallet.wallet_number}",
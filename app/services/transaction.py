@@ -33,7 +33,6 @@ async def create_pending_transaction(
     
     db.add(transaction)
     await db.commit()
-    await db.refresh(transaction)
     
     return transaction
 
@@ -76,6 +75,5 @@ async def update_transaction_status(
     """
     transaction.status = status
     await db.commit()
-    await db.refresh(transaction)
     
     return transaction
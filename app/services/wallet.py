@@ -1,6 +1,9 @@
+import logging
+import secrets
 from decimal import Decimal
-from typing import Optional
-from sqlalchemy import select
+from typing import Optional, Sequence
+from uuid import UUID
+from sqlalchemy import Row, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Wallet, Transaction, TransactionType, TransactionStatus, User
 from app.utils.logger import logger
@@ -22,7 +25,7 @@ async def get_user_wallet(
     Returns:
         Wallet model or None
     """
-    logger.debug(f"Fetching wallet for user: {user_id} (lock={for_update})")
+    logger.debug("Fetching wallet for user: %s (lock=%s)", user_id, for_update)
     query = select(Wallet).where(Wallet.user_id == user_id)
     
     if for_update:
@@ -81,26 +84,75 @@ async def credit_wallet(
     if amount <= 0:
         raise ValueError("Amount must be positive")
 
-    logger.info(
-        f"Crediting wallet: {wallet.wallet_number}",
-        extra={"amount": str(amount), "transaction_ref": transaction.reference}
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Crediting wallet: %s", wallet.wallet_number,
+            extra={"amount": str(amount), "transaction_ref": transaction.reference}
+        )
     
     wallet.balance += amount
     transaction.status = TransactionStatus.SUCCESS
     
     await db.commit()
-    await db.refresh(wallet)
-    await db.refresh(transaction)
     
-    logger.info(
-        f"Wallet credited successfully: {wallet.wallet_number}",
-        extra={"new_balance": str(wallet.balance)}
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Wallet credited successfully: %s", wallet.wallet_number,
+            extra={"new_balance": str(wallet.balance)}
+        )
     
     return wallet
 
 
+async def _debit_wallet(db: AsyncSession, wallet_number: str, amount: Decimal) -> UUID:
+    """
+    Debit a wallet if it holds at least ``amount``, returning its ID.
+    
+    Raises:
+        ValueError: If the wallet does not exist or has insufficient balance
+    """
+    # Balance check and debit happen in the same statement
+    result = await db.execute(
+        update(Wallet)
+        .where(Wallet.wallet_number == wallet_number)
+        .where(Wallet.balance >= amount)
+        .values(balance=Wallet.balance - amount)
+        .returning(Wallet.id)
+    )
+    wallet_id = result.scalar_one_or_none()
+    if wallet_id is not None:
+        return wallet_id
+    
+    # Failure path only: find out why the debit matched no row
+    wallet = await get_wallet_by_number(db, wallet_number)
+    if not wallet:
+        raise ValueError("One or both wallets not found")
+    logger.warning(
+        "Transfer failed - insufficient balance",
+        extra={"balance": str(wallet.balance), "amount": str(amount)}
+    )
+    raise ValueError("Insufficient balance")
+
+
+async def _credit_wallet(db: AsyncSession, wallet_number: str, amount: Decimal) -> UUID:
+    """
+    Credit a wallet by ``amount``, returning its ID.
+    
+    Raises:
+        ValueError: If the wallet does not exist
+    """
+    result = await db.execute(
+        update(Wallet)
+        .where(Wallet.wallet_number == wallet_number)
+        .values(balance=Wallet.balance + amount)
+        .returning(Wallet.id)
+    )
+    wallet_id = result.scalar_one_or_none()
+    if wallet_id is None:
+        raise ValueError("One or both wallets not found")
+    return wallet_id
+
+
 async def transfer_funds(
     db: AsyncSession,
     sender_wallet_number: str,
@@ -108,7 +160,11 @@ async def transfer_funds(
     amount: Decimal
 ) -> tuple[Transaction, Transaction]:
     """
-    Transfer funds between wallets atomically with row locking.
+    Transfer funds between wallets atomically in a single database transaction.
+    
+    Balances are adjusted with conditional UPDATE ... RETURNING statements so
+    the balance check and the debit happen in one statement, without holding
+    row locks across Python code.
     
     Args:
         db: Database session
@@ -125,89 +181,67 @@ async def transfer_funds(
     if amount <= 0:
         raise ValueError("Amount must be positive")
 
-    logger.info(
-        f"Initiating transfer: {sender_wallet_number} -> {recipient_wallet_number}",
-        extra={"amount": str(amount)}
-    )
-    
-    # Deadlock Prevention: Always acquire locks in consistent order (e.g., lexical order of wallet numbers)
-    # This prevents Wallet A sending to B waiting for B sending to A
-    first_wallet_num, second_wallet_num = sorted([sender_wallet_number, recipient_wallet_number])
-    
-    # Fetch both wallets with locks
-    w1 = await get_wallet_by_number(db, first_wallet_num, for_update=True)
-    w2 = await get_wallet_by_number(db, second_wallet_num, for_update=True)
-    
-    if not w1 or not w2:
-        raise ValueError("One or both wallets not found")
-        
-    # Identify which is sender and recipient
-    sender_wallet = w1 if w1.wallet_number == sender_wallet_number else w2
-    recipient_wallet = w2 if w2.wallet_number == recipient_wallet_number else w1
-    
-    if sender_wallet.balance < amount:
-        logger.warning(
-            f"Transfer failed - insufficient balance",
-            extra={"balance": str(sender_wallet.balance), "amount": str(amount)}
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Initiating transfer: %s -> %s", sender_wallet_number, recipient_wallet_number,
+            extra={"amount": str(amount)}
         )
-        raise ValueError("Insufficient balance")
     
     # Generate reference
-    import uuid
-    reference = f"TRF_{uuid.uuid4().hex[:12].upper()}"
-    
-    # Create transactions
-    sender_txn = Transaction(
-        wallet_id=sender_wallet.id,
-        type=TransactionType.TRANSFER_OUT,
-        amount=amount,
-        reference=f"{reference}_OUT",
-        status=TransactionStatus.PENDING,
-        meta={"recipient_wallet": recipient_wallet.wallet_number}
-    )
-    
-    recipient_txn = Transaction(
-        wallet_id=recipient_wallet.id,
-        type=TransactionType.TRANSFER_IN,
-        amount=amount,
-        reference=f"{reference}_IN",
-        status=TransactionStatus.PENDING,
-        meta={"sender_wallet": sender_wallet.wallet_number}
-    )
+    reference = f"TRF_{secrets.token_hex(6).upper()}"
     
     try:
-        # Deduct from sender
-        sender_wallet.balance -= amount
-        sender_txn.status = TransactionStatus.SUCCESS
+        # Deadlock Prevention: Always update rows in consistent order (lexical order of wallet numbers)
+        # This prevents Wallet A sending to B waiting for B sending to A.
+        # Each step raises as soon as it matches no row, so the second UPDATE never
+        # runs (or locks its row) for a transfer that has already failed.
+        if sender_wallet_number < recipient_wallet_number:
+            sender_wallet_id = await _debit_wallet(db, sender_wallet_number, amount)
+            recipient_wallet_id = await _credit_wallet(db, recipient_wallet_number, amount)
+        else:
+            recipient_wallet_id = await _credit_wallet(db, recipient_wallet_number, amount)
+            sender_wallet_id = await _debit_wallet(db, sender_wallet_number, amount)
         
-        # Credit recipient
-        recipient_wallet.balance += amount
-        recipient_txn.status = TransactionStatus.SUCCESS
+        # Create transactions; both rows are flushed in one batched INSERT
+        sender_txn = Transaction(
+            wallet_id=sender_wallet_id,
+            type=TransactionType.TRANSFER_OUT,
+            amount=amount,
+            reference=f"{reference}_OUT",
+            status=TransactionStatus.SUCCESS,
+            meta={"recipient_wallet": recipient_wallet_number}
+        )
         
-        # Add transactions
-        db.add(sender_txn)
-        db.add(recipient_txn)
+        recipient_txn = Transaction(
+            wallet_id=recipient_wallet_id,
+            type=TransactionType.TRANSFER_IN,
+            amount=amount,
+            reference=f"{reference}_IN",
+            status=TransactionStatus.SUCCESS,
+            meta={"sender_wallet": sender_wallet_number}
+        )
         
+        db.add_all([sender_txn, recipient_txn])
         await db.commit()
-        await db.refresh(sender_txn)
-        await db.refresh(recipient_txn)
         
-        logger.info(
-            f"Transfer completed successfully",
-            extra={
-                "reference": reference,
-                "amount": str(amount),
-                "sender": sender_wallet.wallet_number,
-                "recipient": recipient_wallet.wallet_number
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Transfer completed successfully",
+                extra={
+                    "reference": reference,
+                    "amount": str(amount),
+                    "sender": sender_wallet_number,
+                    "recipient": recipient_wallet_number
+                }
+            )
         
         return sender_txn, recipient_txn
         
+    except ValueError:
+        await db.rollback()
+        raise
     except Exception as e:
         await db.rollback()
-        sender_txn.status = TransactionStatus.FAILED
-        recipient_txn.status = TransactionStatus.FAILED
         logger.error(
             f"Transfer failed: {str(e)}",
             extra={"reference": reference},
@@ -220,22 +254,32 @@ async def get_wallet_transactions(
     db: AsyncSession,
     wallet_id: str,
     limit: int = 50
-) -> list[Transaction]:
+) -> Sequence[Row]:
     """
     Get transaction history for a wallet.
     
+    Only the columns needed for the history response are selected, so no
+    ORM instances are built for the rows.
+    
     Args:
         db: Database session
         wallet_id: Wallet ID
         limit: Maximum number of transactions to return
         
     Returns:
-        List of transactions
+        Rows with id, type, amount, reference, status and created_at
     """
     result = await db.execute(
-        select(Transaction)
+        select(
+            Transaction.id,
+            Transaction.type,
+            Transaction.amount,
+            Transaction.reference,
+            Transaction.status,
+            Transaction.created_at,
+        )
         .where(Transaction.wallet_id == wallet_id)
         .order_by(Transaction.created_at.desc())
         .limit(limit)
     )
-    return list(result.scalars().all())
+    return result.all()
@@ -97,7 +97,6 @@ async def process_failed_charge(
     # Mark transaction as failed
     transaction.status = TransactionStatus.FAILED
     await db.commit()
-    await db.refresh(transaction)
     
     logger.info(
         f"Transaction marked as failed: {reference}",
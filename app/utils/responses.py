@@ -1,9 +1,23 @@
 from typing import Optional
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    orjson handles str/int/float/bool/None, lists, dicts, UUIDs and datetimes
+    natively. Stringify Decimals before passing them in as content.
+    """
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 def success_response(status_code: int, message: str, data: Optional[dict] = None):
     """Returns a JSON response for success responses"""
 
@@ -14,9 +28,7 @@ def success_response(status_code: int, message: str, data: Optional[dict] = None
         "data": data or {},  # Ensure data is always a dictionary
     }
 
-    return JSONResponse(
-        status_code=status_code, content=jsonable_encoder(response_data)
-    )
+    return ORJSONResponse(status_code=status_code, content=response_data)
 
 
 def auth_response(
@@ -40,9 +52,7 @@ def auth_response(
         },
     }
 
-    return JSONResponse(
-        status_code=status_code, content=jsonable_encoder(response_data)
-    )
+    return ORJSONResponse(status_code=status_code, content=response_data)
 
 
 def fail_response(status_code: int, message: str, context: Optional[dict] = None):
@@ -55,9 +65,7 @@ def fail_response(status_code: int, message: str, context: Optional[dict] = None
         "error": context or {},
     }
 
-    return JSONResponse(
-        status_code=status_code, content=jsonable_encoder(response_data)
-    )
+    return ORJSONResponse(status_code=status_code, content=response_data)
 
 
 def validation_error_response(errors: dict):
@@ -0,0 +1,38 @@
+import os
+
+# Settings are read at import time; provide test values before the app is imported
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-0123456789abcdef0123456789")
+os.environ.setdefault("API_KEY_PEPPER", "test-api-key-pepper")
+os.environ.setdefault("GOOGLE_CLIENT_ID", "test-google-client-id")
+os.environ.setdefault("GOOGLE_CLIENT_SECRET", "test-google-client-secret")
+os.environ.setdefault("GOOGLE_REDIRECT_URI", "http://localhost:8000/auth/google/callback")
+os.environ.setdefault("PAYSTACK_SECRET_KEY", "sk_test_paystack")
+os.environ.setdefault("PAYSTACK_PUBLIC_KEY", "pk_test_paystack")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+os.environ.setdefault("REDIS_ENABLED", "false")
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+import app.db  # noqa: F401  (registers all models on Base.metadata)
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """Fresh in-memory SQLite database per test."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+    await engine.dispose()
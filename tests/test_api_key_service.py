@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.models import User
+from app.schemas.api_key import APIKeyCreate
+from app.services import api_key as api_key_service
+
+
+class UnusableSession:
+    """Session stand-in that fails the test if any query is issued."""
+
+    async def execute(self, *args, **kwargs):
+        raise AssertionError("API key cache hit should not query the database")
+
+
+@pytest.fixture(autouse=True)
+def clear_api_key_cache():
+    api_key_service._api_key_cache.clear()
+    yield
+    api_key_service._api_key_cache.clear()
+
+
+async def create_key(db, expiry: str = "1D"):
+    """Create a user and an API key for it, returning (user, api_key, plain_key)."""
+    user = User(email="keys@example.com", google_id="google-keys", name="Key Owner")
+    db.add(user)
+    await db.commit()
+
+    api_key, plain_key = await api_key_service.create_api_key(
+        db=db,
+        user_id=user.id,
+        key_data=APIKeyCreate(name="Test Key", permissions=["read", "transfer"], expiry=expiry),
+    )
+    return user, api_key, plain_key
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_database(db_session):
+    """Verify a validated key is served from the cache without a DB query."""
+    user, api_key, plain_key = await create_key(db_session)
+
+    validated = await api_key_service.validate_api_key(db_session, plain_key)
+    assert validated.id == api_key.id
+
+    cached = await api_key_service.validate_api_key(UnusableSession(), plain_key)
+    assert cached.id == api_key.id
+    assert cached.user_id == user.id
+    assert cached.perm_set == frozenset({"read", "transfer"})
+
+
+@pytest.mark.asyncio
+async def test_revoke_evicts_cached_key(db_session):
+    """Verify revoking a key removes it from the cache so it stops validating."""
+    user, api_key, plain_key = await create_key(db_session)
+    assert await api_key_service.validate_api_key(db_session, plain_key) is not None
+    assert len(api_key_service._api_key_cache) == 1
+
+    await api_key_service.revoke_api_key(db_session, user_id=user.id, key_id=api_key.id)
+
+    assert api_key_service._api_key_cache == {}
+    assert await api_key_service.validate_api_key(db_session, plain_key) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_key_rejected_after_expiry(db_session, monkeypatch):
+    """Verify a cached key is rejected once its own expires_at passes."""
+    _, _, plain_key = await create_key(db_session, expiry="1H")
+    assert await api_key_service.validate_api_key(db_session, plain_key) is not None
+
+    class FutureDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(hours=2)
+
+    monkeypatch.setattr(api_key_service, "datetime", FutureDatetime)
+
+    assert await api_key_service.validate_api_key(db_session, plain_key) is None
+    assert api_key_service._api_key_cache == {}
+
+
+def test_cache_evicts_oldest_entry_at_max_size(monkeypatch):
+    """Verify the cache drops its oldest entry once API_KEY_CACHE_MAX_SIZE is reached."""
+    monkeypatch.setattr(api_key_service, "API_KEY_CACHE_MAX_SIZE", 2)
+    expires_at = datetime.now(timezone.utc) + timedelta(days=1)
+
+    for cache_key in ("first", "second", "third"):
+        key_model = SimpleNamespace(
+            id=uuid4(),
+            user_id=uuid4(),
+            key_prefix="abcdefgh",
+            name=cache_key,
+            permissions=["read"],
+            expires_at=expires_at,
+        )
+        api_key_service._cache_api_key(cache_key, key_model)
+
+    assert list(api_key_service._api_key_cache) == ["second", "third"]
@@ -0,0 +1,77 @@
+import hashlib
+import time
+from datetime import timedelta
+
+from app.services import auth as auth_service
+
+
+def setup_function():
+    auth_service._token_cache.clear()
+
+
+def test_decode_access_token_round_trip():
+    """Verify a freshly issued token decodes to its claims."""
+    token = auth_service.create_access_token({"sub": "user-1"})
+    payload = auth_service.decode_access_token(token)
+    assert payload["sub"] == "user-1"
+
+
+def test_token_cache_keyed_by_digest():
+    """Verify raw bearer tokens are never stored as cache keys."""
+    token = auth_service.create_access_token({"sub": "user-1"})
+    auth_service.decode_access_token(token)
+
+    assert list(auth_service._token_cache) == [hashlib.sha256(token.encode("utf-8")).digest()]
+
+
+def test_cached_token_rejected_after_expiry(monkeypatch):
+    """Verify a token served from the decode cache stops working once exp passes."""
+    token = auth_service.create_access_token({"sub": "user-1"}, expires_delta=timedelta(minutes=5))
+    assert auth_service.decode_access_token(token) is not None
+    assert len(auth_service._token_cache) == 1
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("cached token should not be re-verified")
+
+    real_time = time.time
+    monkeypatch.setattr(auth_service.jwt, "decode", fail_decode)
+    monkeypatch.setattr(auth_service.time, "time", lambda: real_time() + 600)
+
+    # The rejection comes from the expiry re-check on the cached payload
+    assert auth_service.decode_access_token(token) is None
+
+
+def test_cached_payload_not_shared_with_callers():
+    """Verify mutating a returned payload does not corrupt the cache."""
+    token = auth_service.create_access_token({"sub": "user-1"})
+    payload = auth_service.decode_access_token(token)
+    payload["sub"] = "attacker"
+
+    assert auth_service.decode_access_token(token)["sub"] == "user-1"
+
+
+def test_invalid_tokens_are_not_cached():
+    """Verify junk bearer tokens are rejected without occupying cache slots."""
+    for i in range(5):
+        assert auth_service.decode_access_token(f"not-a-jwt-{i}") is None
+
+    tampered = auth_service.create_access_token({"sub": "user-1"}) + "x"
+    assert auth_service.decode_access_token(tampered) is None
+
+    assert len(auth_service._token_cache) == 0
+
+
+def test_token_cache_evicts_least_recently_used(monkeypatch):
+    """Verify the cache drops its least recently used entry at TOKEN_CACHE_MAX_SIZE."""
+    monkeypatch.setattr(auth_service, "TOKEN_CACHE_MAX_SIZE", 2)
+    first, second, third = (
+        auth_service.create_access_token({"sub": f"user-{i}"}) for i in range(3)
+    )
+
+    auth_service.decode_access_token(first)
+    auth_service.decode_access_token(second)
+    auth_service.decode_access_token(first)  # refresh first; second is now oldest
+    auth_service.decode_access_token(third)
+
+    digest = lambda token: hashlib.sha256(token.encode("utf-8")).digest()
+    assert list(auth_service._token_cache) == [digest(first), digest(third)]
@@ -16,3 +16,21 @@ def test_root_endpoint():
     data = response.json()
     assert "version" in data
     assert "message" in data
+
+def test_correlation_id_generated():
+    """Verify a correlation ID is added to responses when the client sends none."""
+    response = client.get("/api/v1/wallet/payment/callback")
+    assert response.headers.get("X-Correlation-ID")
+
+def test_correlation_id_echoed():
+    """Verify an incoming correlation ID is echoed back on the response."""
+    response = client.get(
+        "/api/v1/wallet/payment/callback",
+        headers={"X-Correlation-ID": "test-correlation-id"}
+    )
+    assert response.headers["X-Correlation-ID"] == "test-correlation-id"
+
+def test_correlation_id_skipped_for_health():
+    """Verify health checks bypass correlation ID tracking."""
+    response = client.get("/health")
+    assert "X-Correlation-ID" not in response.headers
@@ -0,0 +1,100 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.models import User, Wallet, Transaction, TransactionType, TransactionStatus
+from app.services import wallet as wallet_service
+
+SENDER_NUMBER = "1000000000001"
+RECIPIENT_NUMBER = "2000000000002"
+
+
+async def create_wallet(db, wallet_number: str, balance: str) -> Wallet:
+    """Create a user with a wallet holding the given balance."""
+    user = User(email=f"{wallet_number}@example.com", google_id=wallet_number, name="Test User")
+    db.add(user)
+    await db.flush()
+
+    wallet = Wallet(user_id=user.id, wallet_number=wallet_number, balance=Decimal(balance))
+    db.add(wallet)
+    await db.commit()
+    return wallet
+
+
+async def get_balance(db, wallet_number: str) -> Decimal:
+    """Read a wallet balance straight from the database."""
+    db.expire_all()
+    result = await db.execute(select(Wallet.balance).where(Wallet.wallet_number == wallet_number))
+    return result.scalar_one()
+
+
+async def count_transactions(db) -> int:
+    result = await db.execute(select(Transaction))
+    return len(result.scalars().all())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sender_number,recipient_number", [
+    (SENDER_NUMBER, RECIPIENT_NUMBER),
+    (RECIPIENT_NUMBER, SENDER_NUMBER),
+])
+async def test_transfer_moves_funds_and_records_ledger(db_session, sender_number, recipient_number):
+    """Verify a transfer adjusts both balances and records two successful ledger rows."""
+    sender = await create_wallet(db_session, sender_number, "100.00")
+    recipient = await create_wallet(db_session, recipient_number, "5.00")
+
+    sender_txn, recipient_txn = await wallet_service.transfer_funds(
+        db_session, sender_number, recipient_number, Decimal("30.00")
+    )
+
+    assert sender_txn.wallet_id == sender.id
+    assert sender_txn.type == TransactionType.TRANSFER_OUT
+    assert sender_txn.status == TransactionStatus.SUCCESS
+    assert recipient_txn.wallet_id == recipient.id
+    assert recipient_txn.type == TransactionType.TRANSFER_IN
+    assert recipient_txn.status == TransactionStatus.SUCCESS
+
+    assert await get_balance(db_session, sender_number) == Decimal("70.00")
+    assert await get_balance(db_session, recipient_number) == Decimal("35.00")
+
+    result = await db_session.execute(select(Transaction.status))
+    assert result.scalars().all() == [TransactionStatus.SUCCESS, TransactionStatus.SUCCESS]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sender_number,recipient_number", [
+    (SENDER_NUMBER, RECIPIENT_NUMBER),
+    (RECIPIENT_NUMBER, SENDER_NUMBER),
+])
+async def test_transfer_insufficient_funds_leaves_balances(db_session, sender_number, recipient_number):
+    """Verify an overdrawing transfer fails without touching either wallet."""
+    await create_wallet(db_session, sender_number, "10.00")
+    await create_wallet(db_session, recipient_number, "5.00")
+
+    with pytest.raises(ValueError, match="Insufficient balance"):
+        await wallet_service.transfer_funds(
+            db_session, sender_number, recipient_number, Decimal("30.00")
+        )
+
+    assert await get_balance(db_session, sender_number) == Decimal("10.00")
+    assert await get_balance(db_session, recipient_number) == Decimal("5.00")
+    assert await count_transactions(db_session) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sender_number,missing_number", [
+    (SENDER_NUMBER, RECIPIENT_NUMBER),
+    (RECIPIENT_NUMBER, SENDER_NUMBER),
+])
+async def test_transfer_missing_recipient_rolls_back_debit(db_session, sender_number, missing_number):
+    """Verify a transfer to an unknown wallet does not debit the sender."""
+    await create_wallet(db_session, sender_number, "100.00")
+
+    with pytest.raises(ValueError, match="wallets not found"):
+        await wallet_service.transfer_funds(
+            db_session, sender_number, missing_number, Decimal("30.00")
+        )
+
+    assert await get_balance(db_session, sender_number) == Decimal("100.00")
+    assert await count_transactions(db_session) == 0